@@ -1,4 +1,5 @@
 """IP-based access control middleware for MCP server"""
+import ipaddress
 from fastapi import HTTPException, Request, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from config.settings import settings
@@ -27,7 +28,6 @@ GOOGLE_INTERNAL_RANGES = [
 
 def is_ip_in_range(ip: str, cidr: str) -> bool:
     """Check if an IP address is within a CIDR range"""
-    import ipaddress
     try:
         return ipaddress.ip_address(ip) in ipaddress.ip_network(cidr)
     except ValueError:
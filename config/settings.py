@@ -1,10 +1,27 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Pooled connections a Cortex Search generation holds at once (the schema and
+# business searches run concurrently)
+CONNECTIONS_PER_GENERATION = 2
+
+# Secrets read from GCP Secret Manager at startup
+GCP_SECRET_NAMES = (
+    'SNOWFLAKE_ACCOUNT',
+    'SNOWFLAKE_USER',
+    'SNOWFLAKE_PRIVATE_KEY',
+    'SNOWFLAKE_DATABASE',
+    'SNOWFLAKE_SCHEMA',
+    'SNOWFLAKE_WAREHOUSE',
+    'SNOWFLAKE_ROLE',
+    'OPEN_WEBUI_API_KEY',
+)
+
 class Settings(BaseSettings):
     # Environment
     environment: str = os.getenv('ENVIRONMENT', 'local')
@@ -39,8 +56,11 @@ class Settings(BaseSettings):
     query_timeout: int = 30
     
     # Connection Pool Configuration
-    connection_pool_min_size: int = 2
+    # Keep enough idle for a couple of concurrent Cortex Search generations
+    # (CONNECTIONS_PER_GENERATION each)
+    connection_pool_min_size: int = 4
     connection_pool_max_size: int = 10
+    client_prefetch_threads: int = 8  # Parallel result-chunk downloads per query (connector default is 4)
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -66,15 +86,19 @@ class Settings(BaseSettings):
                 except Exception:
                     return default
             
-            # Load secrets from GCP
-            self.snowflake_account = get_secret('SNOWFLAKE_ACCOUNT') or os.getenv('SNOWFLAKE_ACCOUNT', '')
-            self.snowflake_user = get_secret('SNOWFLAKE_USER') or os.getenv('SNOWFLAKE_USER', '')
-            self.snowflake_private_key = get_secret('SNOWFLAKE_PRIVATE_KEY')
-            self.snowflake_database = get_secret('SNOWFLAKE_DATABASE') or os.getenv('SNOWFLAKE_DATABASE', 'PF')
-            self.snowflake_schema = get_secret('SNOWFLAKE_SCHEMA') or os.getenv('SNOWFLAKE_SCHEMA', 'BI')
-            self.snowflake_warehouse = get_secret('SNOWFLAKE_WAREHOUSE') or os.getenv('SNOWFLAKE_WAREHOUSE', 'COMPUTE_WH')
-            self.snowflake_role = get_secret('SNOWFLAKE_ROLE') or os.getenv('SNOWFLAKE_ROLE')
-            self.open_webui_api_key = get_secret('OPEN_WEBUI_API_KEY') or os.getenv('OPEN_WEBUI_API_KEY', '')
+            # Load secrets from GCP; the lookups are independent, so fetch them
+            # concurrently instead of paying one RPC round-trip after another
+            with ThreadPoolExecutor(max_workers=len(GCP_SECRET_NAMES)) as executor:
+                secrets = dict(zip(GCP_SECRET_NAMES, executor.map(get_secret, GCP_SECRET_NAMES)))
+            
+            self.snowflake_account = secrets['SNOWFLAKE_ACCOUNT'] or os.getenv('SNOWFLAKE_ACCOUNT', '')
+            self.snowflake_user = secrets['SNOWFLAKE_USER'] or os.getenv('SNOWFLAKE_USER', '')
+            self.snowflake_private_key = secrets['SNOWFLAKE_PRIVATE_KEY']
+            self.snowflake_database = secrets['SNOWFLAKE_DATABASE'] or os.getenv('SNOWFLAKE_DATABASE', 'PF')
+            self.snowflake_schema = secrets['SNOWFLAKE_SCHEMA'] or os.getenv('SNOWFLAKE_SCHEMA', 'BI')
+            self.snowflake_warehouse = secrets['SNOWFLAKE_WAREHOUSE'] or os.getenv('SNOWFLAKE_WAREHOUSE', 'COMPUTE_WH')
+            self.snowflake_role = secrets['SNOWFLAKE_ROLE'] or os.getenv('SNOWFLAKE_ROLE')
+            self.open_webui_api_key = secrets['OPEN_WEBUI_API_KEY'] or os.getenv('OPEN_WEBUI_API_KEY', '')
             
         except ImportError:
             raise ImportError("google-cloud-secret-manager is required for GCP secrets")
@@ -104,8 +128,14 @@ class Settings(BaseSettings):
         self.query_timeout = int(os.getenv('QUERY_TIMEOUT', '30'))
         
         # Connection Pool settings
-        self.connection_pool_min_size = int(os.getenv('CONNECTION_POOL_MIN_SIZE', '2'))
+        self.connection_pool_min_size = int(os.getenv('CONNECTION_POOL_MIN_SIZE', '4'))
         self.connection_pool_max_size = int(os.getenv('CONNECTION_POOL_MAX_SIZE', '10'))
+        self.client_prefetch_threads = int(os.getenv('CLIENT_PREFETCH_THREADS', '8'))
+    
+    @property
+    def max_concurrent_generations(self) -> int:
+        """Cortex Search generations that fit in the connection pool at once"""
+        return max(1, self.connection_pool_max_size // CONNECTIONS_PER_GENERATION)
     
     def validate_required_settings(self) -> bool:
         """Validate that all required settings are present"""
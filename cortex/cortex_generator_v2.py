@@ -4,11 +4,15 @@ No more hardcoded constraints or table lists.
 """
 import asyncio
 import logging
-from typing import Dict, Any, Optional, List
+import re
+import time
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple
 from pydantic import BaseModel
 import json
 
 from utils.config import get_environment_snowflake_connection
+from utils.connection_pool import get_pooled_connection
 from config.settings import settings
 from validators.sql_validator import SqlValidator, SqlValidationResult
 from utils.logging import log_cortex_usage
@@ -16,6 +20,11 @@ from utils.prompt_builder import PromptBuilder
 from cortex.view_constraints_loader import ViewConstraintsLoader
 from utils.cortex_search import CortexSearchClient
 
+@lru_cache(maxsize=32)
+def _forbidden_keywords_regex(keywords: Tuple[str, ...]) -> "re.Pattern":
+    """Compile a view's forbidden keywords into one whole-word alternation"""
+    return re.compile(r'\b(' + '|'.join(re.escape(keyword) for keyword in keywords) + r')\b')
+
 class CortexRequest(BaseModel):
     natural_language_query: str
     view_name: str = "MV_CREATOR_PAYMENTS_UNION"  # Default to materialized table
@@ -39,6 +48,15 @@ class CortexGenerator:
     All constraints and metadata loaded dynamically from database tables.
     """
     
+    # Identifiers that are never column references
+    SQL_KEYWORDS = frozenset({'SELECT', 'FROM', 'WHERE', 'GROUP', 'BY', 'ORDER',
+                              'LIMIT', 'AND', 'OR', 'NOT', 'IN', 'LIKE', 'AS',
+                              'ASC', 'DESC', 'HAVING', 'COUNT', 'SUM', 'AVG',
+                              'MAX', 'MIN', 'DISTINCT', 'BETWEEN', 'NULL', 'IS'})
+    
+    # Common literal values that look like column names
+    COMMON_VALUES = frozenset({'PAYMENT_MODE', 'AGENCY_MODE', 'DIRECT_MODE'})
+    
     @classmethod
     async def generate_sql(cls, request: CortexRequest) -> CortexResponse:
         """Generate SQL using Snowflake Cortex with dynamic validation"""
@@ -50,15 +68,20 @@ class CortexGenerator:
                 # NEW: Use Cortex Search for minimal context (90% reduction)
                 logging.info(f"Using Cortex Search for context retrieval")
                 
+                # Load allowed columns from constraints even when using search.
+                # This is normally a cache hit, and passing the result on lets
+                # the search context reuse it instead of fetching it again.
+                constraints = await asyncio.to_thread(ViewConstraintsLoader.load_constraints, request.view_name)
+                
                 # Get minimal, relevant context using search
-                relevant_context = CortexSearchClient.build_minimal_context(
+                relevant_context = await asyncio.to_thread(
+                    CortexSearchClient.build_minimal_context,
                     request.natural_language_query,
-                    request.view_name
+                    request.view_name,
+                    constraints or {}  # Empty, not None, so a missing view isn't fetched twice
                 )
                 
                 # Build minimal prompt
-                # Load allowed columns from constraints even when using search
-                constraints = ViewConstraintsLoader.load_constraints(request.view_name)
                 allowed_columns = "REFERENCE_ID, PAYMENT_TYPE, REFERENCE_TYPE, USER_ID, CREATOR_NAME, COMPANY_NAME, CAMPAIGN_NAME, PAYMENT_AMOUNT, PAYMENT_STATUS, PAYMENT_DATE, CREATED_DATE, STRIPE_CUSTOMER_ID, STRIPE_CUSTOMER_NAME, STRIPE_CONNECTED_ACCOUNT_ID, STRIPE_CONNECTED_ACCOUNT_NAME"
                 if constraints and constraints.get("allowed_columns"):
                     allowed_columns = constraints["allowed_columns"]
@@ -114,7 +137,6 @@ Return only the SQL, no explanation."""
             prompt = built.prompt_text
             
             # Execute Cortex SQL generation
-            import time
             start_gen = time.time()
             generated_sql = await cls.call_cortex_complete(prompt)
             generation_time_ms = int((time.time() - start_gen) * 1000)
@@ -177,67 +199,68 @@ Return only the SQL, no explanation."""
         
         # Check forbidden keywords (must be whole words, not part of column names)
         forbidden = constraints.get("forbidden_keywords", [])
-        import re
-        for keyword in forbidden:
-            # Use word boundaries to avoid matching column names like CREATED_DATE
-            pattern = r'\b' + keyword.upper() + r'\b'
-            if re.search(pattern, sql_upper):
+        if forbidden:
+            # Use word boundaries to avoid matching column names like CREATED_DATE;
+            # a single compiled pass replaces one regex search per keyword
+            keywords_by_upper = {keyword.upper(): keyword for keyword in forbidden}
+            match = _forbidden_keywords_regex(tuple(keywords_by_upper)).search(sql_upper)
+            if match:
                 return SqlValidationResult(
                     is_valid=False,
-                    error=f"Forbidden operation '{keyword}' detected in SQL"
+                    error=f"Forbidden operation '{keywords_by_upper[match.group(1)]}' detected in SQL"
                 )
         
         # Check that only allowed columns are referenced
         allowed_cols = set(col.upper() for col in constraints.get("allowed_columns", []))
         
         # Simple check - could be made more sophisticated
-        import re
         # Find potential column references (simplified)
         potential_cols = re.findall(r'\b([A-Z_][A-Z0-9_]*)\b', sql_upper)
         
         # Filter out SQL keywords and the table name
-        sql_keywords = {'SELECT', 'FROM', 'WHERE', 'GROUP', 'BY', 'ORDER', 
-                       'LIMIT', 'AND', 'OR', 'NOT', 'IN', 'LIKE', 'AS', 
-                       'ASC', 'DESC', 'HAVING', 'COUNT', 'SUM', 'AVG', 
-                       'MAX', 'MIN', 'DISTINCT', 'BETWEEN', 'NULL', 'IS'}
+        view_upper = view_name.upper()
         
         for col in potential_cols:
-            if col not in sql_keywords and col != view_name.upper():
+            if col not in cls.SQL_KEYWORDS and col != view_upper:
                 # Check if it looks like a column and isn't allowed
                 if '_' in col and col not in allowed_cols:
                     # This might be a column reference
-                    if col not in {'PAYMENT_MODE', 'AGENCY_MODE', 'DIRECT_MODE'}:  # Common values
+                    if col not in cls.COMMON_VALUES:
                         logging.warning(f"Potential unauthorized column reference: {col}")
         
         return SqlValidationResult(is_valid=True)
 
+    @staticmethod
+    def _run_cortex_complete(prompt: str):
+        """Execute COMPLETE on a pooled connection (blocking; call via asyncio.to_thread)"""
+        with get_pooled_connection() as conn:
+            cursor = conn.cursor()
+            
+            # Execute Cortex COMPLETE function
+            cortex_sql = """
+            SELECT SNOWFLAKE.CORTEX.COMPLETE(
+                %s,
+                %s
+            ) as generated_sql
+            """
+            
+            cursor.execute(cortex_sql, (settings.cortex_model, prompt))
+            result = cursor.fetchone()
+            
+            cursor.close()
+        return result
+
     @classmethod
     async def call_cortex_complete(cls, prompt: str) -> str:
         """Call Snowflake Cortex COMPLETE function"""
         try:
-            from utils.connection_pool import get_pooled_connection
-            
-            with get_pooled_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Execute Cortex COMPLETE function
-                cortex_sql = """
-                SELECT SNOWFLAKE.CORTEX.COMPLETE(
-                    %s,
-                    %s
-                ) as generated_sql
-                """
-                
-                cursor.execute(cortex_sql, (settings.cortex_model, prompt))
-                result = cursor.fetchone()
-                
-                cursor.close()
+            # The LLM round-trip takes seconds; keep it off the event loop
+            result = await asyncio.to_thread(cls._run_cortex_complete, prompt)
             
             if result and result[0]:
                 generated_sql = str(result[0]).strip()
                 
                 # Clean up common Cortex response formatting
-                import re
                 # Handle various markdown formats
                 sql_match = re.search(r'```(?:sql)?\s*\n?(.*?)\n?```', generated_sql, re.DOTALL | re.IGNORECASE)
                 if sql_match:
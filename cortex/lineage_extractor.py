@@ -151,37 +151,47 @@ def write_lineage_json(
 def upsert_ai_schema_metadata_relationships(
     conn, database: str, schema: str, view_name: str, column_lineage: List[ColumnLineage]
 ):
-    cursor = conn.cursor()
-    try:
-        for col in column_lineage:
-            relationships_json = json.dumps(
-                {
-                    "variants": [
-                        {
-                            "source_object": 
-                                f"{src.get('table_catalog')}.{src.get('table_schema')}.{src.get('table_name')}",
-                        }
-                        for src in col.sources
-                    ],
-                    "notes": col.notes,
-                }
-            )
+    if not column_lineage:
+        return
 
-            # Try update first
-            update_sql = (
-                "UPDATE PF.BI.AI_SCHEMA_METADATA "
-                "SET RELATIONSHIPS = %s "
-                "WHERE TABLE_NAME = %s AND COLUMN_NAME = %s"
-            )
-            cursor.execute(update_sql, (relationships_json, view_name, col.column_name))
-            if cursor.rowcount == 0:
-                # Insert minimal row
-                insert_sql = (
-                    "INSERT INTO PF.BI.AI_SCHEMA_METADATA (ID, TABLE_NAME, COLUMN_NAME, RELATIONSHIPS) "
-                    "SELECT COALESCE(MAX(ID),0)+1, %s, %s, %s FROM PF.BI.AI_SCHEMA_METADATA"
-                )
-                cursor.execute(insert_sql, (view_name, col.column_name, relationships_json))
+    rows: List[Tuple[str, str]] = []
+    for col in column_lineage:
+        relationships_json = json.dumps(
+            {
+                "variants": [
+                    {
+                        "source_object": 
+                            f"{src.get('table_catalog')}.{src.get('table_schema')}.{src.get('table_name')}",
+                    }
+                    for src in col.sources
+                ],
+                "notes": col.notes,
+            }
+        )
+        rows.append((col.column_name, relationships_json))
+
+    # One MERGE for all columns instead of an UPDATE (plus INSERT on miss) per column.
+    # New rows get sequential IDs above the current MAX(ID).
+    values_sql = ", ".join(["(%s, %s)"] * len(rows))
+    merge_sql = (
+        "MERGE INTO PF.BI.AI_SCHEMA_METADATA t "
+        "USING ("
+        "SELECT v.COLUMN1 AS COLUMN_NAME, v.COLUMN2 AS RELATIONSHIPS, "
+        "m.MAX_ID + ROW_NUMBER() OVER (ORDER BY v.COLUMN1) AS NEW_ID "
+        f"FROM (VALUES {values_sql}) v "
+        "CROSS JOIN (SELECT COALESCE(MAX(ID),0) AS MAX_ID FROM PF.BI.AI_SCHEMA_METADATA) m"
+        ") s "
+        "ON t.TABLE_NAME = %s AND t.COLUMN_NAME = s.COLUMN_NAME "
+        "WHEN MATCHED THEN UPDATE SET RELATIONSHIPS = s.RELATIONSHIPS "
+        "WHEN NOT MATCHED THEN INSERT (ID, TABLE_NAME, COLUMN_NAME, RELATIONSHIPS) "
+        "VALUES (s.NEW_ID, %s, s.COLUMN_NAME, s.RELATIONSHIPS)"
+    )
+    params: List[Any] = [value for row in rows for value in row]
+    params.extend([view_name, view_name])
 
+    cursor = conn.cursor()
+    try:
+        cursor.execute(merge_sql, params)
         conn.commit()
     finally:
         cursor.close()
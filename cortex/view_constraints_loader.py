@@ -2,16 +2,76 @@
 Load view constraints from database instead of hardcoding them.
 This ensures AI_VIEW_CONSTRAINTS is the single source of truth.
 """
+import json
 import logging
-from typing import Dict, List, Optional, Any
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple
 from utils.config import get_environment_snowflake_connection
 from utils.connection_pool import get_pooled_connection
 
+# System tables that are always queryable regardless of AI_VIEW_CONSTRAINTS
+_SYSTEM_TABLES = frozenset({
+    'AI_USER_ACTIVITY_LOG',
+    'AI_BUSINESS_CONTEXT',
+    'AI_SCHEMA_METADATA',
+    'AI_VIEW_CONSTRAINTS',
+    'AI_CORTEX_PROMPTS',
+    'AI_CORTEX_USAGE_LOG',
+    'AI_MCP_TOOLS',
+    'AI_MCP_USER_GROUPS',
+    'AI_MCP_TOOL_GROUP_ACCESS'
+})
+
+# Minimal safe set returned when the database cannot be reached
+_FALLBACK_TABLES = ('MV_CREATOR_PAYMENTS_UNION', 'V_CREATOR_PAYMENTS_UNION')
+
 class ViewConstraintsLoader:
     """Load view constraints from AI_VIEW_CONSTRAINTS table"""
     
+    # Constraints only change when narratives are reprocessed, so reuse them
+    # for a few minutes instead of querying on every generation
+    CACHE_TTL_SECONDS = 300
+    CACHE_MAX_SIZE = 128
+    
+    _cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+    _cache_lock = threading.Lock()
+    
+    @classmethod
+    def load_constraints(cls, view_name: str) -> Optional[Dict[str, Any]]:
+        """Load constraints for a specific view/table, served from cache while fresh"""
+        cache_key = view_name.strip().upper()
+        now = time.monotonic()
+        
+        with cls._cache_lock:
+            entry = cls._cache.get(cache_key)
+            if entry and now - entry[0] < cls.CACHE_TTL_SECONDS:
+                cls._cache.move_to_end(cache_key)
+                return entry[1]
+        
+        # Fetch with the normalized name so the result never depends on
+        # which spelling happened to populate the cache first
+        constraints = cls._fetch_constraints(cache_key)
+        
+        # Misses and errors are not cached so a fixed row is picked up immediately
+        if constraints is not None:
+            with cls._cache_lock:
+                cls._cache[cache_key] = (now, constraints)
+                cls._cache.move_to_end(cache_key)
+                while len(cls._cache) > cls.CACHE_MAX_SIZE:
+                    cls._cache.popitem(last=False)
+        
+        return constraints
+    
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached constraints"""
+        with cls._cache_lock:
+            cls._cache.clear()
+    
     @staticmethod
-    def load_constraints(view_name: str) -> Optional[Dict[str, Any]]:
+    def _fetch_constraints(view_name: str) -> Optional[Dict[str, Any]]:
         """Load constraints for a specific view/table from database"""
         try:
             with get_pooled_connection() as conn:
@@ -32,8 +92,6 @@ class ViewConstraintsLoader:
                 cursor.close()
             
             if result:
-                import json
-                
                 # Parse JSON fields
                 allowed_ops = json.loads(result[0]) if result[0] else []
                 allowed_cols = json.loads(result[1]) if result[1] else []
@@ -49,7 +107,7 @@ class ViewConstraintsLoader:
             
             # Try backward compatibility with old view name
             if view_name == "MV_CREATOR_PAYMENTS_UNION":
-                return ViewConstraintsLoader.load_constraints("V_CREATOR_PAYMENTS_UNION")
+                return ViewConstraintsLoader._fetch_constraints("V_CREATOR_PAYMENTS_UNION")
                 
             return None
             
@@ -76,24 +134,14 @@ class ViewConstraintsLoader:
                 results = cursor.fetchall()
                 cursor.close()
             
+            # UNION already deduplicates in Snowflake, so only the
+            # system tables need merging in
             allowed_tables = [row[0] for row in results if row[0]]
+            allowed_tables.extend(_SYSTEM_TABLES.difference(allowed_tables))
             
-            # Always include system tables
-            system_tables = {
-                'AI_USER_ACTIVITY_LOG',
-                'AI_BUSINESS_CONTEXT',
-                'AI_SCHEMA_METADATA',
-                'AI_VIEW_CONSTRAINTS',
-                'AI_CORTEX_PROMPTS',
-                'AI_CORTEX_USAGE_LOG',
-                'AI_MCP_TOOLS',
-                'AI_MCP_USER_GROUPS',
-                'AI_MCP_TOOL_GROUP_ACCESS'
-            }
-            
-            return list(set(allowed_tables) | system_tables)
+            return allowed_tables
             
         except Exception as error:
             logging.error(f"Failed to load allowed tables from database: {error}")
             # Return minimal set for safety
-            return ['MV_CREATOR_PAYMENTS_UNION', 'V_CREATOR_PAYMENTS_UNION']
\ No newline at end of file
+            return list(_FALLBACK_TABLES)
\ No newline at end of file
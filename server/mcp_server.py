@@ -8,8 +8,10 @@ from mcp.server.lowlevel.server import InitializationOptions
 from mcp.types import TextContent, Tool
 
 from config.settings import settings
-from utils.config import get_environment_snowflake_connection, setup_logging
+from utils.config import setup_logging
+from utils.connection_pool import ping_snowflake
 from tools.dynamic_registry import initialize_registry, get_registry
+from utils.logging import log_activity
 
 class SnowflakeMCP:
     def __init__(self):
@@ -44,8 +46,6 @@ class SnowflakeMCP:
         @self.server.list_tools()
         async def list_tools() -> List[Tool]:
             """Return list of available tools from dynamic registry"""
-            from utils.logging import log_activity
-            
             registry = get_registry()
             
             # Get tools for default group (stdio doesn't support groups yet)
@@ -55,7 +55,8 @@ class SnowflakeMCP:
             else:
                 self.logger.warning("Tool registry not available - returning empty tool list")
             
-            # Log the list_tools operation for consistency with HTTP server
+            # Log the list_tools operation for consistency with HTTP server;
+            # this only queues the row for the background activity writer
             await log_activity(
                 tool_name="list_tools",
                 arguments={},
@@ -109,14 +110,8 @@ class SnowflakeMCP:
     async def test_snowflake_connection(self):
         """Test Snowflake connectivity during startup"""
         try:
-            conn = get_environment_snowflake_connection()
-            
-            cursor = conn.cursor()
-            cursor.execute("SELECT 1 as test")
-            result = cursor.fetchone()
-            
-            cursor.close()
-            conn.close()
+            # Borrow from the shared pool so the startup check also warms it
+            result = await asyncio.to_thread(ping_snowflake)
             
             self.logger.info(f"Snowflake connection test passed: {result}")
             
@@ -6,6 +6,7 @@ import asyncio
 import json
 import logging
 import os
+import time
 from contextlib import asynccontextmanager
 from typing import Dict, Any, List, Optional
 
@@ -18,9 +19,10 @@ import uvicorn
 from config.settings import settings
 from utils.config import setup_logging
 from auth_middleware.bearer_auth import validate_bearer_token
-from auth_middleware.simple_auth import validate_auth
+from auth_middleware.simple_auth import validate_auth, get_client_ip
 from tools.dynamic_registry import initialize_registry, get_registry
-from utils.logging import log_activity
+from utils.logging import log_activity, flush_activity_log
+from utils.connection_pool import get_pooled_connection, ping_snowflake, close_pool
 
 
 class ToolCallRequest(BaseModel):
@@ -59,13 +61,7 @@ async def lifespan(app: FastAPI):
     # Test Snowflake connection (skip in production due to IP whitelisting)
     if settings.environment != 'production':
         try:
-            from utils.config import get_environment_snowflake_connection
-            conn = get_environment_snowflake_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT 1 as test")
-            result = cursor.fetchone()
-            cursor.close()
-            conn.close()
+            result = await asyncio.to_thread(ping_snowflake)
             logger.info(f"✅ Snowflake connection test passed: {result}")
         except Exception as error:
             logger.error(f"❌ Snowflake connection test failed: {error}")
@@ -91,6 +87,8 @@ async def lifespan(app: FastAPI):
     logger.info("🚀 HTTP MCP Server initialized successfully")
     yield
     logger.info("🛑 HTTP MCP Server shutting down")
+    await asyncio.to_thread(flush_activity_log)
+    close_pool()
 
 
 # Create FastAPI app
@@ -118,13 +116,33 @@ app.add_middleware(
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     """Log all incoming requests with IP information"""
-    from auth_middleware.simple_auth import get_client_ip
     client_ip = get_client_ip(request)
     logging.info(f"Request from {client_ip}: {request.method} {request.url.path}")
     response = await call_next(request)
     return response
 
 
+# Probes hit /health every few seconds; reuse the last Snowflake ping for this long
+HEALTH_CHECK_TTL_SECONDS = 30
+_health_state: Dict[str, Any] = {"snowflake_connected": None, "checked_at": None}
+_health_lock = asyncio.Lock()
+
+
+async def _cached_snowflake_status() -> bool:
+    """Return the last Snowflake ping result, re-pinging once it is older than the TTL"""
+    async with _health_lock:
+        checked_at = _health_state["checked_at"]
+        if checked_at is None or time.monotonic() - checked_at >= HEALTH_CHECK_TTL_SECONDS:
+            try:
+                await asyncio.to_thread(ping_snowflake)
+                _health_state["snowflake_connected"] = True
+            except Exception as e:
+                logging.warning(f"Snowflake connection check failed: {str(e)}")
+                _health_state["snowflake_connected"] = False
+            _health_state["checked_at"] = time.monotonic()
+        return _health_state["snowflake_connected"]
+
+
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint for container orchestration"""
@@ -134,19 +152,8 @@ async def health_check():
         snowflake_connected = None  # Unknown status
         logging.info("Production environment - Snowflake connection test skipped until IP whitelisted")
     else:
-        # Local: Test actual connection
-        try:
-            from utils.config import get_environment_snowflake_connection
-            conn = get_environment_snowflake_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT 1")
-            cursor.fetchone()
-            cursor.close()
-            conn.close()
-            snowflake_connected = True
-        except Exception as e:
-            logging.warning(f"Snowflake connection check failed: {str(e)}")
-            snowflake_connected = False
+        # Local: Test actual connection (cached for HEALTH_CHECK_TTL_SECONDS)
+        snowflake_connected = await _cached_snowflake_status()
     
     return HealthResponse(
         status="healthy",  # Always healthy for Cloud Run startup
@@ -156,21 +163,9 @@ async def health_check():
     )
 
 
-@app.get("/diagnostics", operation_id="diagnostics_get")
-async def diagnostics(token: str = Depends(validate_auth)):
-    """Run diagnostics on the MCP server including logging capability"""
-    diagnostics_results = {
-        "environment": settings.environment,
-        "snowflake_connection": False,
-        "logging_capability": False,
-        "recent_logs_check": False,
-        "errors": []
-    }
-    
-    try:
-        # Test Snowflake connection
-        from utils.config import get_environment_snowflake_connection
-        conn = get_environment_snowflake_connection()
+def _run_diagnostic_queries(diagnostics_results: Dict[str, Any]) -> None:
+    """Run the diagnostics checks against Snowflake, recording each step as it passes"""
+    with get_pooled_connection() as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT 1 as test")
         cursor.fetchone()
@@ -201,8 +196,22 @@ async def diagnostics(token: str = Depends(validate_auth)):
         diagnostics_results["recent_logs_count"] = result[0] if result else 0
         
         cursor.close()
-        conn.close()
-        
+
+
+@app.get("/diagnostics", operation_id="diagnostics_get")
+async def diagnostics(token: str = Depends(validate_auth)):
+    """Run diagnostics on the MCP server including logging capability"""
+    diagnostics_results = {
+        "environment": settings.environment,
+        "snowflake_connection": False,
+        "logging_capability": False,
+        "recent_logs_check": False,
+        "errors": []
+    }
+    
+    try:
+        # Blocking connector calls run off the event loop
+        await asyncio.to_thread(_run_diagnostic_queries, diagnostics_results)
     except Exception as error:
         diagnostics_results["errors"].append(str(error))
         logging.error(f"Diagnostics error: {error}", exc_info=True)
@@ -236,20 +245,12 @@ async def list_tools(request: Request, token: str = Depends(validate_auth), grou
                     detail=f"Unknown group: {group}. Valid groups are: default, admins, accountmanagers"
                 )
             
-            tools = registry.get_tools_for_group(group)
+            # Serialized definitions are cached per group by the registry
+            tools_list = registry.get_tool_dicts_for_group(group)
         else:
             # No tools available if registry fails
             logging.error("Tool registry not available - no tools to list")
-            tools = []
-        
-        # Convert MCP Tool objects to JSON-serializable format
-        tools_list = []
-        for tool in tools:
-            tools_list.append({
-                "name": tool.name,
-                "description": tool.description,
-                "inputSchema": tool.inputSchema
-            })
+            tools_list = []
         
         # Log list_tools activity with proper parameters
         await log_activity(
@@ -420,40 +421,41 @@ async def get_openapi(group_path: str = None):
 @app.post("/v1/chat/completions")
 async def openwebui_chat_completions(request: Request, token: str = Depends(validate_auth)):
     """OpenAI-compatible endpoint for Open WebUI integration"""
+    registry = get_registry()
     return JSONResponse(
         status_code=501,
         content={
             "error": "This MCP server provides tools, not chat completions. Use /tools endpoints instead.",
             "available_endpoints": ["/tools", "/tools/call"],
-            "tools_count": len(get_snowflake_tools()) + len(get_cortex_tools())
+            "tools_count": len(registry.tools) if registry else 0
         }
     )
 
 
-async def main():
+def main():
     """Main entry point for production HTTP server"""
     port = int(os.getenv("PORT", "8000"))
     host = os.getenv("HOST", "0.0.0.0")
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
     
-    # Configure uvicorn for production
-    config = uvicorn.Config(
-        app=app,
+    logging.info(f"🚀 Starting HTTP MCP Server on {host}:{port} with {workers} worker(s)")
+    logging.info(f"📊 Environment: {settings.environment}")
+    logging.info(f"🔒 Authentication: Bearer token required")
+    logging.info(f"📖 Documentation: http://{host}:{port}/docs")
+    
+    # Let uvicorn own the event loop so it can use uvloop and httptools
+    # (both installed by uvicorn[standard]); workers need the app import string
+    uvicorn.run(
+        "server.mcp_server_http:app",
         host=host,
         port=port,
-        loop="asyncio",
+        loop="auto",
+        http="auto",
+        workers=workers,
         log_level="info",
         access_log=True
     )
-    
-    server = uvicorn.Server(config)
-    
-    logging.info(f"🚀 Starting HTTP MCP Server on {host}:{port}")
-    logging.info(f"📊 Environment: {settings.environment}")
-    logging.info(f"🔒 Authentication: Bearer token required")
-    logging.info(f"📖 Documentation: http://{host}:{port}/docs")
-    
-    await server.serve()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    main()
@@ -0,0 +1,21 @@
+"""
+Shared helpers for the Cortex integration scripts
+"""
+import asyncio
+
+from config.settings import settings
+
+
+async def gather_cases(check, cases):
+    """Run check(*case) for every case concurrently, in the order of cases
+    
+    At most settings.max_concurrent_generations cases run at once so the
+    suite stays within the connection pool.
+    """
+    semaphore = asyncio.Semaphore(settings.max_concurrent_generations)
+    
+    async def run_case(case):
+        async with semaphore:
+            return await check(*case)
+    
+    return await asyncio.gather(*(run_case(case) for case in cases))
@@ -4,6 +4,7 @@ Test creator synonym variations to ensure they reference CREATOR_NAME correctly
 """
 import asyncio
 from cortex.cortex_generator_v2 import CortexGenerator, CortexRequest
+from tests.integration.helpers import gather_cases
 
 # Test cases for creator synonyms
 TEST_CASES = [
@@ -24,7 +25,10 @@ TEST_CASES = [
 ]
 
 async def test_creator_reference(query: str, expected):
-    """Test if creator synonyms are properly understood"""
+    """Test if creator synonyms are properly understood
+    
+    Returns the result message and the generated SQL (None on failure).
+    """
     request = CortexRequest(
         natural_language_query=query,
         view_name='MV_CREATOR_PAYMENTS_UNION',
@@ -34,7 +38,7 @@ async def test_creator_reference(query: str, expected):
     response = await CortexGenerator.generate_sql(request)
     
     if not response.success or not response.generated_sql:
-        return f"❌ FAILED to generate SQL for: {query}"
+        return f"❌ FAILED to generate SQL for: {query}", None
     
     sql = response.generated_sql.upper()
     
@@ -46,17 +50,17 @@ async def test_creator_reference(query: str, expected):
             if exp in sql or f"{exp}_NAME" in sql or f"STRIPE_CONNECTED_ACCOUNT" in sql:
                 found.append(exp)
         if len(found) == len(expected):
-            return f"✅ PASS: '{query}' → references {', '.join(found)}"
+            return f"✅ PASS: '{query}' → references {', '.join(found)}", response.generated_sql
         else:
-            return f"⚠️  PARTIAL: '{query}' → found {found} (expected {expected})"
+            return f"⚠️  PARTIAL: '{query}' → found {found} (expected {expected})", response.generated_sql
     else:
         # Single expected reference
         if "CREATOR_NAME" in sql or "STRIPE_CONNECTED_ACCOUNT" in sql:
-            return f"✅ PASS: '{query}' → references creator fields"
+            return f"✅ PASS: '{query}' → references creator fields", response.generated_sql
         elif expected in sql:
-            return f"✅ PASS: '{query}' → references {expected}"
+            return f"✅ PASS: '{query}' → references {expected}", response.generated_sql
         else:
-            return f"❌ FAIL: '{query}' → doesn't reference creator fields"
+            return f"❌ FAIL: '{query}' → doesn't reference creator fields", response.generated_sql
 
 async def main():
     print("Testing Creator Synonym Translations...")
@@ -64,11 +68,15 @@ async def main():
     
     results = []
     failures = []
+    generated_sql = {}
+    
+    outcomes = await gather_cases(test_creator_reference, TEST_CASES)
     
-    for query, expected in TEST_CASES:
-        result = await test_creator_reference(query, expected)
+    for (query, expected), (result, sql) in zip(TEST_CASES, outcomes):
         print(result)
         results.append(result)
+        if sql:
+            generated_sql[query] = sql
         
         if "FAIL" in result:
             failures.append((query, expected, result))
@@ -84,7 +92,8 @@ async def main():
     else:
         print("\n🎉 All creator synonym translations working correctly!")
     
-    # Show actual SQL for a few examples
+    # Show actual SQL for a few examples (reusing the SQL generated above
+    # instead of paying for another Cortex call per example)
     print("\n" + "=" * 60)
     print("Example SQL generated:")
     example_queries = [
@@ -94,15 +103,9 @@ async def main():
     ]
     
     for query in example_queries:
-        request = CortexRequest(
-            natural_language_query=query,
-            view_name='MV_CREATOR_PAYMENTS_UNION',
-            max_rows=100
-        )
-        response = await CortexGenerator.generate_sql(request)
-        if response.success:
+        if query in generated_sql:
             print(f"\n{query}:")
-            print(f"  → {response.generated_sql}")
+            print(f"  → {generated_sql[query]}")
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
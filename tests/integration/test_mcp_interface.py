@@ -24,6 +24,8 @@ if not API_KEY:
 BASE_URL = "http://localhost:8000"  # For local testing
 # BASE_URL = "https://mcp.popfly.com"  # For production
 
+SESSION = requests.Session()
+
 def call_mcp_tool(tool_name: str, arguments: Dict[str, Any]) -> Dict:
     """Call an MCP tool through the HTTP interface"""
     headers = {
@@ -38,7 +40,7 @@ def call_mcp_tool(tool_name: str, arguments: Dict[str, Any]) -> Dict:
     
     # Use the appropriate group endpoint
     # For admins group (has query_payments access)
-    response = requests.post(
+    response = SESSION.post(
         f"{BASE_URL}/admins/tools/call",
         headers=headers,
         json=payload
@@ -6,13 +6,29 @@ This will properly log all activities to AI_USER_ACTIVITY_LOG
 import requests
 import json
 import time
-from typing import Dict, Any, List, Tuple
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
 # Production configuration
 BASE_URL = "https://mcp.popfly.com"
 API_KEY = "sk-snowflake-mcp-dZOl9vjv2Ylcg8oT0LLmumh3S9ugU6x2jdVmXVoqJqU"
 
+# Shared session so every call reuses the pooled HTTPS connection
+SESSION = requests.Session()
+
+# Minimum spacing between calls to stay within the server's rate limit
+MIN_CALL_INTERVAL_SECONDS = 0.5
+_last_call_time = 0.0
+
+def wait_for_rate_limit():
+    """Sleep only for whatever remains of the minimum interval since the last call"""
+    global _last_call_time
+    remaining = MIN_CALL_INTERVAL_SECONDS - (time.monotonic() - _last_call_time)
+    if remaining > 0:
+        time.sleep(remaining)
+    _last_call_time = time.monotonic()
+
 def call_mcp_tool(tool_name: str, arguments: Dict[str, Any], group: str = "admins") -> Dict:
     """Call an MCP tool through the HTTP interface"""
     headers = {
@@ -25,7 +41,8 @@ def call_mcp_tool(tool_name: str, arguments: Dict[str, Any], group: str = "admin
         "arguments": arguments
     }
     
-    response = requests.post(
+    wait_for_rate_limit()
+    response = SESSION.post(
         f"{BASE_URL}/{group}/tools/call",
         headers=headers,
         json=payload,
@@ -43,6 +60,16 @@ def call_mcp_tool(tool_name: str, arguments: Dict[str, Any], group: str = "admin
     else:
         return {"error": f"HTTP {response.status_code}: {response.text}"}
 
+@lru_cache(maxsize=32)
+def parse_result_rows(text: str) -> Optional[List[Dict]]:
+    """Parse a JSON array response once; repeat lookups for the same text are cached"""
+    if not text.startswith('['):
+        return None
+    try:
+        return json.loads(text)
+    except ValueError:
+        return None
+
 def extract_sql_from_response(result: Dict) -> str:
     """Extract generated SQL from MCP response"""
     if result.get("success"):
@@ -91,18 +118,13 @@ def test_payment_query(query: str) -> Tuple[bool, str, str]:
         if content and len(content) > 0:
             text = content[0].get("text", "")
             # Check if we got results (JSON array)
-            if text.startswith('['):
-                import json
-                try:
-                    data = json.loads(text)
-                    if data and len(data) > 0:
-                        # Check the PAYMENT_TYPE in the results
-                        payment_types = set(row.get('PAYMENT_TYPE', '') for row in data)
-                        print(f"✅ Success - Found {len(data)} results")
-                        print(f"   Payment Types: {', '.join(payment_types)}")
-                        return True, text, ""
-                except:
-                    pass
+            data = parse_result_rows(text)
+            if data:
+                # Check the PAYMENT_TYPE in the results
+                payment_types = {row.get('PAYMENT_TYPE', '') for row in data}
+                print(f"✅ Success - Found {len(data)} results")
+                print(f"   Payment Types: {', '.join(payment_types)}")
+                return True, text, ""
             print(f"⚠️  Success but unexpected response format")
             return True, text, ""
         else:
@@ -118,28 +140,25 @@ def analyze_synonym_translation(query: str, data: str, expected_value: str) -> s
     if not data:
         return "NO_DATA"
     
-    # Parse JSON data
-    try:
-        import json
-        if data.startswith('['):
-            results = json.loads(data)
-            if results:
-                # Check PAYMENT_TYPE values in results
-                payment_types = set(row.get('PAYMENT_TYPE', '') for row in results)
-                
-                if expected_value in payment_types:
-                    return "CORRECT"
-                elif len(payment_types) > 0:
-                    actual = ', '.join(payment_types)
-                    return f"WRONG_TYPE:{actual}"
-                else:
-                    return "NO_PAYMENT_TYPE"
-            else:
-                return "NO_RESULTS"
-    except:
-        pass
+    # Reuses the rows already parsed by test_payment_query
+    results = parse_result_rows(data)
+    if results is None:
+        return "PARSE_ERROR"
+    if not results:
+        return "NO_RESULTS"
+    
+    # Stop scanning PAYMENT_TYPE values as soon as the expected one appears
+    payment_types = set()
+    for row in results:
+        payment_type = row.get('PAYMENT_TYPE', '')
+        if payment_type == expected_value:
+            return "CORRECT"
+        payment_types.add(payment_type)
     
-    return "PARSE_ERROR"
+    if payment_types:
+        actual = ', '.join(payment_types)
+        return f"WRONG_TYPE:{actual}"
+    return "NO_PAYMENT_TYPE"
 
 def main():
     print("=" * 80)
@@ -202,7 +221,6 @@ def main():
                 print(f"   ⚠️  PAYMENT_TYPE not referenced in query")
         else:
             business_results.append((query, expected, "ERROR"))
-        time.sleep(0.5)  # Rate limiting
     
     # Creator synonym tests
     print("\n" + "=" * 80)
@@ -234,7 +252,6 @@ def main():
                 print(f"   ❌ No creator field references")
         else:
             creator_results.append((query, "ERROR"))
-        time.sleep(0.5)
     
     # Complex queries
     print("\n" + "=" * 80)
@@ -253,7 +270,6 @@ def main():
         success, sql, error = test_payment_query(query)
         if success:
             print(f"   ✅ Query executed successfully")
-        time.sleep(0.5)
     
     # Summary
     print("\n" + "=" * 80)
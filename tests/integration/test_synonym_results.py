@@ -8,6 +8,8 @@ import json
 API_KEY = 'sk-snowflake-mcp-dZOl9vjv2Ylcg8oT0LLmumh3S9ugU6x2jdVmXVoqJqU'
 BASE_URL = 'https://mcp.popfly.com'
 
+SESSION = requests.Session()
+
 # Test cases: query -> expected PAYMENT_TYPE
 test_cases = [
     # Agency Mode (labs) synonyms
@@ -49,7 +51,7 @@ for query, expected in test_cases:
     }
     
     try:
-        response = requests.post(
+        response = SESSION.post(
             f'{BASE_URL}/admins/tools/call',
             headers=headers,
             json=payload,
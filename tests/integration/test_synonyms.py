@@ -4,6 +4,7 @@ Test synonym variations for PAYMENT_TYPE to ensure proper translation
 """
 import asyncio
 from cortex.cortex_generator_v2 import CortexGenerator, CortexRequest
+from tests.integration.helpers import gather_cases
 
 # Test cases: (query phrase, expected canonical value)
 TEST_CASES = [
@@ -60,8 +61,9 @@ async def main():
     results = []
     failures = []
     
-    for query, expected in TEST_CASES:
-        result = await test_synonym(query, expected)
+    outcomes = await gather_cases(test_synonym, TEST_CASES)
+    
+    for (query, expected), result in zip(TEST_CASES, outcomes):
         print(result)
         results.append(result)
         
@@ -0,0 +1,73 @@
+"""
+Tests for background activity logging
+"""
+import asyncio
+import threading
+from contextlib import contextmanager
+from unittest.mock import MagicMock
+
+import utils.logging as activity_logging
+
+
+def test_log_activity_is_written_in_batches(monkeypatch):
+    """Queued rows are inserted by the writer thread with one statement per batch"""
+    conn = MagicMock()
+
+    @contextmanager
+    def fake_pooled_connection():
+        yield conn
+
+    monkeypatch.setattr(activity_logging, 'get_pooled_connection', fake_pooled_connection)
+
+    async def log_calls():
+        for tool_name in ('list_tools', 'read_query'):
+            await activity_logging.log_activity(tool_name=tool_name, arguments={"group": "default"})
+
+    asyncio.run(log_calls())
+    activity_logging.flush_activity_log()
+
+    cursor = conn.cursor.return_value
+    written_tools = []
+    for call in cursor.execute.call_args_list:
+        sql, params = call.args
+        rows = sql.count('as USER_EMAIL')
+        assert len(params) == rows * 10
+        written_tools.extend(params[3::10])
+
+    assert written_tools == ['list_tools', 'read_query']
+    assert conn.commit.called
+
+
+def test_flush_gives_up_after_timeout(monkeypatch):
+    """A timed-out flush reports unwritten rows and stops the writer touching Snowflake"""
+    monkeypatch.setattr(activity_logging, '_activity_stopped', threading.Event())
+    release = threading.Event()
+    written = []
+
+    def stuck_write(batch):
+        written.append(len(batch))
+        release.wait()
+
+    monkeypatch.setattr(activity_logging, '_write_activity_batch', stuck_write)
+
+    async def log_calls():
+        await activity_logging.log_activity(tool_name='list_tools', arguments={})
+        # Let the writer pick up the first row before queueing the second
+        while not written:
+            await asyncio.sleep(0.01)
+        await activity_logging.log_activity(tool_name='read_query', arguments={})
+
+    asyncio.run(log_calls())
+
+    try:
+        assert activity_logging.flush_activity_log(timeout=0.05) == 2
+        # Later flushes (e.g. atexit after lifespan) don't wait again
+        assert activity_logging.flush_activity_log(timeout=5) == 2
+    finally:
+        release.set()
+
+    with activity_logging._activity_pending_changed:
+        activity_logging._activity_pending_changed.wait_for(lambda: activity_logging._activity_pending == 0, timeout=1)
+
+    # The queued row was dropped instead of written
+    assert written == [1]
@@ -0,0 +1,73 @@
+"""
+Tests for ConnectionPool checkout behaviour
+"""
+import time
+from contextlib import ExitStack
+from unittest.mock import MagicMock
+
+import pytest
+
+from utils.connection_pool import ConnectionPool
+
+
+@pytest.fixture
+def make_pool(monkeypatch):
+    """Build pools whose connections are mocks instead of Snowflake sessions"""
+    monkeypatch.setattr(ConnectionPool, '_get_connection_params', lambda self: {})
+    monkeypatch.setattr(ConnectionPool, '_create_connection', lambda self: MagicMock())
+    pools = []
+
+    def factory(min_size, max_size):
+        pool = ConnectionPool(min_size=min_size, max_size=max_size)
+        pools.append(pool)
+        return pool
+
+    yield factory
+    for pool in pools:
+        pool.close_all()
+
+
+def test_empty_pool_grows_without_waiting(make_pool):
+    """A checkout beyond the idle connections opens a new one instead of blocking"""
+    pool = make_pool(min_size=1, max_size=3)
+
+    with pool.get_connection(timeout=5) as first:
+        started = time.monotonic()
+        with pool.get_connection(timeout=5) as second:
+            assert time.monotonic() - started < 1
+            assert first is not second
+            assert pool.get_stats()['in_use'] == 2
+
+
+def test_pool_at_max_size_reports_exhaustion(make_pool):
+    """Once max_size connections are checked out, further callers time out"""
+    pool = make_pool(min_size=1, max_size=1)
+
+    with pool.get_connection():
+        with pytest.raises(RuntimeError, match="exhausted"):
+            with pool.get_connection(timeout=0.05):
+                pass
+
+
+def test_second_burst_reuses_grown_connections(make_pool, monkeypatch):
+    """Connections opened for a burst stay pooled for the next one"""
+    created = []
+
+    def create_connection(self):
+        conn = MagicMock()
+        created.append(conn)
+        return conn
+
+    monkeypatch.setattr(ConnectionPool, '_create_connection', create_connection)
+    pool = make_pool(min_size=1, max_size=10)
+
+    def burst(size):
+        with ExitStack() as stack:
+            return {id(stack.enter_context(pool.get_connection())) for _ in range(size)}
+
+    first = burst(4)
+    second = burst(4)
+
+    assert len(created) == 4
+    assert first == second
+    assert pool.get_stats() == {'available': 4, 'total': 4, 'in_use': 0}
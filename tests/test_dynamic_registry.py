@@ -0,0 +1,59 @@
+"""
+Tests for DynamicToolRegistry group tool lists
+"""
+from tools.dynamic_registry import DynamicToolRegistry, DynamicTool
+
+
+def _registry_with_tool() -> DynamicToolRegistry:
+    """Build a registry holding one tool in the default group"""
+    registry = DynamicToolRegistry()
+    registry.tools = {
+        'query_payments': DynamicTool(
+            tool_id=1,
+            tool_name='query_payments',
+            tool_description='Query payment data',
+            input_schema={"type": "object", "properties": {}},
+            handler_module='tools.payment_tools',
+            handler_function='query_payments_handler',
+            is_shared=True,
+            is_active=True,
+            uses_cortex=True
+        )
+    }
+    registry.tools_by_group = {'default': ['query_payments']}
+    return registry
+
+
+def test_tools_for_group_are_cached():
+    """Repeated list_tools calls reuse the same Tool list"""
+    registry = _registry_with_tool()
+    
+    first = registry.get_tools_for_group('default')
+    second = registry.get_tools_for_group(None)
+    
+    assert [tool.name for tool in first] == ['query_payments']
+    assert first is second
+
+
+def test_unknown_group_is_not_cached():
+    """Unknown groups return an empty list without populating the cache"""
+    registry = _registry_with_tool()
+    
+    assert registry.get_tools_for_group('unknown') == []
+    assert 'unknown' not in registry._group_tools_cache
+
+
+def test_tool_dicts_for_group_are_cached():
+    """Serialized tool definitions are built once per group"""
+    registry = _registry_with_tool()
+    
+    first = registry.get_tool_dicts_for_group('default')
+    
+    assert first == [{
+        "name": 'query_payments',
+        "description": 'Query payment data',
+        "inputSchema": {"type": "object", "properties": {}}
+    }]
+    assert registry.get_tool_dicts_for_group(None) is first
+    assert registry.get_tool_dicts_for_group('unknown') == []
+    assert 'unknown' not in registry._group_tool_dicts_cache
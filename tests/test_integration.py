@@ -55,7 +55,7 @@ class TestMCPServerIntegration:
         mock_cursor = mock_conn.cursor.return_value
         
         # Mock successful query execution
-        mock_cursor.fetchall.return_value = [
+        mock_cursor.fetchmany.return_value = [
             ('John Doe', 1500.0, 'PAID'),
             ('Jane Smith', 2000.0, 'PENDING')
         ]
@@ -64,7 +64,7 @@ class TestMCPServerIntegration:
         ]
         
         # Initialize server
-        with patch('server.mcp_server.get_environment_snowflake_connection'):
+        with patch('server.mcp_server.ping_snowflake'):
             server = SnowflakeMCP()
             await server.init()
         
@@ -0,0 +1,36 @@
+"""
+Tests for loading settings from GCP Secret Manager
+"""
+from unittest.mock import MagicMock
+
+from google.cloud import secretmanager
+
+from config.settings import GCP_SECRET_NAMES, Settings
+
+
+def test_gcp_secrets_are_fetched_once_each_with_env_fallback(monkeypatch):
+    """Every startup secret is requested once; missing ones fall back to the environment"""
+    secrets = {'SNOWFLAKE_ACCOUNT': 'acct', 'SNOWFLAKE_USER': 'user', 'SNOWFLAKE_PRIVATE_KEY': 'key'}
+    client = MagicMock()
+
+    def access_secret_version(request):
+        secret_name = request["name"].split("/")[3]
+        if secret_name not in secrets:
+            raise Exception(f"Secret {secret_name} not found")
+        response = MagicMock()
+        response.payload.data = secrets[secret_name].encode("UTF-8")
+        return response
+
+    client.access_secret_version.side_effect = access_secret_version
+    monkeypatch.setattr(secretmanager, 'SecretManagerServiceClient', lambda: client, raising=False)
+    monkeypatch.setenv('SNOWFLAKE_ROLE', 'env_role')
+
+    loaded = Settings(use_gcp_secrets=True, gcp_project_id='test-project')
+
+    requested = sorted(call.kwargs['request']['name'].split('/')[3]
+                       for call in client.access_secret_version.call_args_list)
+    assert requested == sorted(GCP_SECRET_NAMES)
+    assert loaded.snowflake_account == 'acct'
+    assert loaded.snowflake_user == 'user'
+    assert loaded.snowflake_private_key == 'key'
+    assert loaded.snowflake_role == 'env_role'
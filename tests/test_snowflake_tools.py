@@ -0,0 +1,52 @@
+"""
+Tests for read_query row capping
+"""
+import asyncio
+from contextlib import contextmanager
+from unittest.mock import MagicMock
+
+import tools.snowflake_tools as snowflake_tools
+
+
+def _run_read_query(monkeypatch, rows, max_rows, is_internal):
+    """Run read_query_handler against a cursor that serves the given rows"""
+    cursor = MagicMock()
+    cursor.description = [('REFERENCE_ID',)]
+    cursor.fetchmany.side_effect = lambda size: rows[:size]
+    conn = MagicMock()
+    conn.cursor.return_value = cursor
+
+    @contextmanager
+    def fake_pooled_connection():
+        yield conn
+
+    async def fake_log_activity(*args, **kwargs):
+        pass
+
+    monkeypatch.setattr(snowflake_tools, 'get_pooled_connection', fake_pooled_connection)
+    monkeypatch.setattr(snowflake_tools, 'log_activity', fake_log_activity)
+
+    result = asyncio.run(snowflake_tools.read_query_handler(
+        {"query": "SELECT REFERENCE_ID FROM MV_CREATOR_PAYMENTS_UNION LIMIT 5000", "max_rows": max_rows},
+        is_internal=is_internal
+    ))
+    return result[0].text
+
+
+def test_rows_beyond_max_rows_are_reported_as_truncated(monkeypatch):
+    """An explicit LIMIT above max_rows is capped with a visible notice"""
+    rows = [(i,) for i in range(5)]
+
+    internal = _run_read_query(monkeypatch, rows, max_rows=3, is_internal=True)
+    assert internal.startswith("3 rows returned: ")
+    assert "truncated to max_rows (3)" in internal
+
+    external = _run_read_query(monkeypatch, rows, max_rows=3, is_internal=False)
+    assert "truncated to max_rows (3)" in external
+
+
+def test_results_within_max_rows_have_no_notice(monkeypatch):
+    """Result sets that fit in max_rows are returned unchanged"""
+    internal = _run_read_query(monkeypatch, [(1,), (2,)], max_rows=3, is_internal=True)
+
+    assert internal == '2 rows returned: [{"REFERENCE_ID": 1}, {"REFERENCE_ID": 2}]'
@@ -0,0 +1,65 @@
+"""
+Tests for ViewConstraintsLoader constraint caching
+"""
+import pytest
+
+from cortex.view_constraints_loader import ViewConstraintsLoader
+
+
+@pytest.fixture
+def fetch_calls(monkeypatch):
+    """Replace the database fetch with a stub that records each call"""
+    calls = []
+
+    def fake_fetch(view_name):
+        calls.append(view_name)
+        if view_name == 'MISSING_VIEW':
+            return None
+        return {"allowed_columns": ["REFERENCE_ID"], "forbidden_keywords": []}
+
+    ViewConstraintsLoader.clear_cache()
+    monkeypatch.setattr(ViewConstraintsLoader, '_fetch_constraints', staticmethod(fake_fetch))
+    yield calls
+    ViewConstraintsLoader.clear_cache()
+
+
+def test_constraints_are_cached_per_view(fetch_calls):
+    """Repeated loads for the same view hit the database once"""
+    first = ViewConstraintsLoader.load_constraints('MV_CREATOR_PAYMENTS_UNION')
+    second = ViewConstraintsLoader.load_constraints('MV_CREATOR_PAYMENTS_UNION')
+
+    assert first is second
+    assert fetch_calls == ['MV_CREATOR_PAYMENTS_UNION']
+
+
+def test_view_names_are_normalized_before_fetching(fetch_calls):
+    """Any spelling of a view name is fetched as its normalized name"""
+    first = ViewConstraintsLoader.load_constraints(' mv_creator_payments_union ')
+    second = ViewConstraintsLoader.load_constraints('MV_CREATOR_PAYMENTS_UNION')
+
+    assert first is not None
+    assert first is second
+    assert fetch_calls == ['MV_CREATOR_PAYMENTS_UNION']
+
+
+def test_expired_and_missing_entries_are_refetched(fetch_calls, monkeypatch):
+    """Entries past the TTL and unknown views are loaded again"""
+    ViewConstraintsLoader.load_constraints('MISSING_VIEW')
+    ViewConstraintsLoader.load_constraints('MISSING_VIEW')
+    assert fetch_calls == ['MISSING_VIEW', 'MISSING_VIEW']
+
+    monkeypatch.setattr(ViewConstraintsLoader, 'CACHE_TTL_SECONDS', 0)
+    ViewConstraintsLoader.load_constraints('MV_CREATOR_PAYMENTS_UNION')
+    ViewConstraintsLoader.load_constraints('MV_CREATOR_PAYMENTS_UNION')
+    assert fetch_calls.count('MV_CREATOR_PAYMENTS_UNION') == 2
+
+
+def test_cache_is_bounded(fetch_calls, monkeypatch):
+    """Least recently used views are evicted beyond CACHE_MAX_SIZE"""
+    monkeypatch.setattr(ViewConstraintsLoader, 'CACHE_MAX_SIZE', 2)
+
+    for view_name in ('VIEW_A', 'VIEW_B', 'VIEW_A', 'VIEW_C', 'VIEW_A'):
+        ViewConstraintsLoader.load_constraints(view_name)
+
+    assert fetch_calls == ['VIEW_A', 'VIEW_B', 'VIEW_C']
+    assert list(ViewConstraintsLoader._cache) == ['VIEW_C', 'VIEW_A']
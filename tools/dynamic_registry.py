@@ -2,6 +2,7 @@
 Dynamic Tool Registry for MCP Server
 Loads tool definitions from database and manages handler routing
 """
+import asyncio
 import importlib
 import json
 import logging
@@ -33,11 +34,15 @@ class DynamicToolRegistry:
         self.tools: Dict[str, DynamicTool] = {}
         self.tools_by_group: Dict[str, List[str]] = {}
         self.groups: Dict[str, Dict[str, Any]] = {}
+        self._group_tools_cache: Dict[str, List[Tool]] = {}
+        self._group_tool_dicts_cache: Dict[str, List[Dict[str, Any]]] = {}
         self.logger = logging.getLogger(__name__)
         
     def load_from_database(self) -> None:
         """Load all tools and groups from database on startup"""
         self.logger.info("Loading dynamic tools from database...")
+        self._group_tools_cache.clear()
+        self._group_tool_dicts_cache.clear()
         
         try:
             with get_pooled_connection() as conn:
@@ -117,6 +122,9 @@ class DynamicToolRegistry:
                 
                 cursor.close()
             
+            # Drop any tool lists built while loading was in progress
+            self._group_tools_cache.clear()
+            self._group_tool_dicts_cache.clear()
             self.logger.info(f"Loaded {len(self.tools)} tools and {len(self.groups)} groups")
             
         except Exception as e:
@@ -152,9 +160,17 @@ class DynamicToolRegistry:
         return self.tools.get(tool_name)
     
     def get_tools_for_group(self, group_path: Optional[str] = None) -> List[Tool]:
-        """Get MCP Tool objects available for a specific group"""
+        """Get MCP Tool objects available for a specific group
+        
+        Tool lists are static once loaded, so they are built once per group
+        and reused until the registry is reloaded.
+        """
         path = group_path or 'default'
         
+        cached = self._group_tools_cache.get(path)
+        if cached is not None:
+            return cached
+        
         if path not in self.tools_by_group:
             # Unknown group - return empty list or raise error
             # We'll return empty list to indicate invalid group
@@ -171,8 +187,30 @@ class DynamicToolRegistry:
                     inputSchema=tool_def.input_schema
                 ))
         
+        self._group_tools_cache[path] = tools
         return tools
     
+    def get_tool_dicts_for_group(self, group_path: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get JSON-serializable tool definitions for a group, built once per group"""
+        path = group_path or 'default'
+        
+        cached = self._group_tool_dicts_cache.get(path)
+        if cached is not None:
+            return cached
+        
+        tool_dicts = [
+            {
+                "name": tool.name,
+                "description": tool.description,
+                "inputSchema": tool.inputSchema
+            }
+            for tool in self.get_tools_for_group(path)
+        ]
+        
+        if path in self.tools_by_group:
+            self._group_tool_dicts_cache[path] = tool_dicts
+        return tool_dicts
+    
     def is_valid_group(self, group_path: str) -> bool:
         """Check if a group path is valid"""
         path = group_path or 'default'
@@ -214,7 +252,6 @@ class DynamicToolRegistry:
         # Call handler
         try:
             # Check if it's an async handler
-            import asyncio
             if asyncio.iscoroutinefunction(handler):
                 result = await handler(arguments, bearer_token, None)  # request_id will be generated in handler
             else:
@@ -2,10 +2,12 @@
 Payment-related tools for MCP Server
 These handlers are called by the dynamic tool registry
 """
+import datetime
 import json
 import logging
 import re
 import time
+import uuid
 from typing import Dict, Any, List
 from mcp.types import TextContent
 from pydantic import BaseModel, validator
@@ -34,8 +36,6 @@ class QueryPaymentsSchema(BaseModel):
 
 async def query_payments_handler(arguments: Dict[str, Any], bearer_token: str = None, request_id: str = None) -> List[TextContent]:
     """Query payment data using natural language via Snowflake Cortex"""
-    import uuid
-    
     # Generate request ID if not provided
     if request_id is None:
         request_id = str(uuid.uuid4())
@@ -116,7 +116,6 @@ async def query_payments_handler(arguments: Dict[str, Any], bearer_token: str =
                         
                         # Add temporal context to the response
                         # Check if the query or SQL references current time periods
-                        import datetime
                         current_date = datetime.datetime.now()
                         
                         # Detect if query is about current time period
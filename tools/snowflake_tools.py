@@ -10,6 +10,7 @@ from utils.connection_pool import get_pooled_connection
 from config.settings import settings
 from validators.sql_validator import SqlValidator
 from utils.response_helpers import create_success_response, create_error_response
+from utils.response_formatters import format_table_results
 from utils.logging import log_activity
 
 # Pydantic schemas for input validation
@@ -57,19 +58,22 @@ async def read_query_handler(arguments: Dict[str, Any], bearer_token: str = None
                 limited_query += f" LIMIT {params.max_rows}"
             
             cursor.execute(limited_query)
-            results = cursor.fetchall()
+            # Never materialize more than max_rows, even when the query's own
+            # LIMIT is larger (or "LIMIT" only appears in an identifier); the
+            # extra row only tells us whether anything was cut off
+            results = cursor.fetchmany(params.max_rows + 1)
+            truncated = len(results) > params.max_rows
             column_names = [desc[0] for desc in cursor.description]
             
             # Convert to list of dictionaries
-            result_list = []
-            for row in results:
-                result_dict = {}
-                for i, value in enumerate(row):
-                    result_dict[column_names[i]] = value
-                result_list.append(result_dict)
+            result_list = [dict(zip(column_names, row)) for row in results[:params.max_rows]]
             
             cursor.close()
         
+        truncation_notice = ""
+        if truncated:
+            truncation_notice = f"Results truncated to max_rows ({params.max_rows}); narrow the query or raise max_rows to see more."
+        
         execution_time_ms = int((time.time() - start_time) * 1000)
         await log_activity(
             "read_query", 
@@ -85,13 +89,16 @@ async def read_query_handler(arguments: Dict[str, Any], bearer_token: str = None
         # Return raw data for internal calls, formatted for external
         if is_internal:
             # Return raw JSON data for internal processing
-            import json
             raw_json = json.dumps(result_list, default=str)
-            return [TextContent(type="text", text=f"{len(result_list)} rows returned: {raw_json}")]
+            text = f"{len(result_list)} rows returned: {raw_json}"
+            if truncated:
+                text += f"\n{truncation_notice}"
+            return [TextContent(type="text", text=text)]
         else:
             # Use clean formatting for external calls
-            from utils.response_formatters import format_table_results
             clean_result = format_table_results(result_list, f"Query: {params.query}")
+            if truncated:
+                clean_result += f"\n\n**Note:** {truncation_notice}"
             return [TextContent(type="text", text=clean_result)]
         
     except Exception as error:
@@ -4,7 +4,7 @@ Snowflake connection pool manager for improved performance
 import logging
 import threading
 from queue import Queue, Empty
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from contextlib import contextmanager
 import snowflake.connector
 from snowflake.connector import SnowflakeConnection
@@ -28,6 +28,7 @@ class ConnectionPool:
         self.max_size = max_size
         self._pool = Queue(maxsize=max_size)
         self._all_connections = set()
+        self._creating = 0  # Slots reserved by connects still in progress
         self._lock = threading.Lock()
         self._closed = False
         
@@ -54,6 +55,8 @@ class ConnectionPool:
                 'schema': settings.snowflake_schema,
                 'warehouse': settings.snowflake_warehouse,
                 'role': settings.snowflake_role,
+                'client_prefetch_threads': settings.client_prefetch_threads,
+                'client_session_keep_alive': True,  # Idle pooled sessions would otherwise expire
                 'session_parameters': {
                     'QUERY_TAG': 'mcp_server_pooled'
                 }
@@ -73,6 +76,8 @@ class ConnectionPool:
                 'schema': settings.snowflake_schema,
                 'warehouse': settings.snowflake_warehouse,
                 'role': settings.snowflake_role,
+                'client_prefetch_threads': settings.client_prefetch_threads,
+                'client_session_keep_alive': True,  # Idle pooled sessions would otherwise expire
                 'session_parameters': {
                     'QUERY_TAG': 'mcp_server_pooled'
                 }
@@ -98,6 +103,39 @@ class ConnectionPool:
             except Exception as e:
                 logging.warning(f"Failed to create initial connection: {e}")
     
+    def _checkout(self, timeout: Optional[float]) -> Tuple[SnowflakeConnection, bool]:
+        """Take an idle connection, or open a new one while under max_size
+        
+        Returns the connection and whether it was newly created.
+        """
+        try:
+            return self._pool.get_nowait(), False
+        except Empty:
+            pass
+        
+        # Grow right away instead of waiting out the timeout, so concurrent
+        # lookups from one request don't queue behind the idle connections.
+        # The slot is reserved under the lock; the connect happens outside it.
+        with self._lock:
+            can_grow = len(self._all_connections) + self._creating < self.max_size
+            if can_grow:
+                self._creating += 1
+        
+        if can_grow:
+            try:
+                conn = self._create_connection()
+                with self._lock:
+                    self._all_connections.add(conn)
+                return conn, True
+            finally:
+                with self._lock:
+                    self._creating -= 1
+        
+        try:
+            return self._pool.get(timeout=timeout), False
+        except Empty:
+            raise RuntimeError("Connection pool exhausted")
+    
     @contextmanager
     def get_connection(self, timeout: Optional[float] = 5.0):
         """
@@ -116,33 +154,24 @@ class ConnectionPool:
         created_new = False
         
         try:
-            # Try to get from pool
-            try:
-                conn = self._pool.get(timeout=timeout)
-                # Test if connection is still alive
-                cursor = conn.cursor()
-                cursor.execute("SELECT 1")
-                cursor.close()
-            except Empty:
-                # Pool is empty, try to create new connection if under max
-                with self._lock:
-                    if len(self._all_connections) < self.max_size:
-                        conn = self._create_connection()
-                        self._all_connections.add(conn)
-                        created_new = True
-                    else:
-                        raise RuntimeError("Connection pool exhausted")
-            except Exception:
-                # Connection is dead, create a new one
-                if conn:
+            conn, created_new = self._checkout(timeout)
+            
+            if not created_new:
+                try:
+                    # Test if connection is still alive
+                    cursor = conn.cursor()
+                    cursor.execute("SELECT 1")
+                    cursor.close()
+                except Exception:
+                    # Connection is dead, create a new one
                     self._all_connections.discard(conn)
                     try:
                         conn.close()
                     except:
                         pass
-                conn = self._create_connection()
-                self._all_connections.add(conn)
-                created_new = True
+                    conn = self._create_connection()
+                    self._all_connections.add(conn)
+                    created_new = True
             
             yield conn
             
@@ -155,13 +184,10 @@ class ConnectionPool:
                     cursor.execute("SELECT 1")
                     cursor.close()
                     
-                    if not created_new or self._pool.qsize() < self.min_size:
-                        self._pool.put(conn)
-                    else:
-                        # Pool has enough connections, close this one
-                        with self._lock:
-                            self._all_connections.discard(conn)
-                        conn.close()
+                    # Keep connections opened during a burst idle (the pool never
+                    # holds more than max_size) so the next burst reuses them
+                    # instead of paying another Snowflake login per checkout
+                    self._pool.put(conn)
                 except:
                     # Connection is unhealthy, close it
                     with self._lock:
@@ -217,7 +243,7 @@ def get_pool() -> ConnectionPool:
         with _pool_lock:
             if _pool is None:
                 _pool = ConnectionPool(
-                    min_size=settings.connection_pool_min_size if hasattr(settings, 'connection_pool_min_size') else 2,
+                    min_size=settings.connection_pool_min_size if hasattr(settings, 'connection_pool_min_size') else 4,
                     max_size=settings.connection_pool_max_size if hasattr(settings, 'connection_pool_max_size') else 10
                 )
     
@@ -240,6 +266,16 @@ def get_pooled_connection(timeout: Optional[float] = 5.0):
         yield conn
 
 
+def ping_snowflake():
+    """Run SELECT 1 on a pooled connection (blocking; call via asyncio.to_thread)"""
+    with get_pooled_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT 1 as test")
+        result = cursor.fetchone()
+        cursor.close()
+    return result
+
+
 def close_pool():
     """Close the global connection pool"""
     global _pool
@@ -3,12 +3,21 @@ Cortex Search integration for dynamic context retrieval
 Reduces prompt size from 5KB to ~500 bytes using native Snowflake search
 """
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from utils.connection_pool import get_pooled_connection
 import json
 import requests
 from config.settings import settings
+from cortex.view_constraints_loader import ViewConstraintsLoader
+
+# Shared worker threads for the concurrent search lookups; more workers than
+# pooled connections would only queue on the pool
+_search_executor = ThreadPoolExecutor(
+    max_workers=settings.connection_pool_max_size,
+    thread_name_prefix="cortex-search"
+)
 
 @dataclass
 class SearchResult:
@@ -171,7 +180,6 @@ class CortexSearchClient:
                 # Direct query since we're looking for exact match
                 sql = """
                 SELECT 
-                    1.0 as relevance_score,
                     VIEW_NAME,
                     BUSINESS_CONTEXT,
                     ALLOWED_OPERATIONS,
@@ -190,11 +198,11 @@ class CortexSearchClient:
                         source="constraint",
                         relevance_score=1.0,
                         data={
-                            "view_name": row[1],
-                            "business_context": row[2],
-                            "allowed_operations": row[3],
-                            "forbidden_keywords": row[4],
-                            "allowed_columns": row[5]
+                            "view_name": row[0],
+                            "business_context": row[1],
+                            "allowed_operations": row[2],
+                            "forbidden_keywords": row[3],
+                            "allowed_columns": row[4]
                         }
                     )
                     cursor.close()
@@ -212,7 +220,8 @@ class CortexSearchClient:
     def build_minimal_context(
         cls,
         query: str,
-        view_name: str = "MV_CREATOR_PAYMENTS_UNION"
+        view_name: str = "MV_CREATOR_PAYMENTS_UNION",
+        constraints: Optional[Dict[str, Any]] = None
     ) -> str:
         """
         Build minimal context using Cortex Search results
@@ -220,14 +229,25 @@ class CortexSearchClient:
         Args:
             query: Natural language query from user
             view_name: The view/table being queried
+            constraints: View constraints already loaded by the caller; read
+                from the ViewConstraintsLoader cache when omitted
             
         Returns:
             Formatted minimal context string (target: 500-1000 chars)
         """
         context_parts = []
         
+        # The two searches are independent, so run the business search on the
+        # shared executor while this thread runs the schema search; constraints
+        # come from the loader's cache rather than a third pooled connection
+        business_future = _search_executor.submit(cls.search_business_context, query)
+        schema_results = cls.search_schema_context(query, view_name, 8)  # Increased limit
+        business_results = business_future.result()
+        
+        if constraints is None:
+            constraints = ViewConstraintsLoader.load_constraints(view_name)
+        
         # Get relevant schema columns
-        schema_results = cls.search_schema_context(query, view_name, limit=8)  # Increased limit
         if schema_results:
             columns = []
             for result in schema_results[:8]:  # Top 8 most relevant
@@ -243,7 +263,6 @@ class CortexSearchClient:
                 context_parts.append("Relevant columns:\n" + "\n".join(f"- {c}" for c in columns))
         
         # Get business context
-        business_results = cls.search_business_context(query)
         if business_results:
             for result in business_results[:2]:  # Top 2 rules
                 data = result.data
@@ -253,12 +272,10 @@ class CortexSearchClient:
                     context_parts.append(f"Rule: {desc}")
         
         # Get view constraints
-        constraints = cls.get_view_constraints(view_name)
-        if constraints:
-            data = constraints.data
-            if data.get('allowed_operations'):
-                ops = data['allowed_operations'][:100] + "..." if len(data['allowed_operations']) > 100 else data['allowed_operations']
-                context_parts.append(f"Allowed operations: {ops}")
+        if constraints and constraints.get('allowed_operations'):
+            allowed_ops = ', '.join(str(op) for op in constraints['allowed_operations'])
+            ops = allowed_ops[:100] + "..." if len(allowed_ops) > 100 else allowed_ops
+            context_parts.append(f"Allowed operations: {ops}")
         
         # Combine and limit size
         full_context = "\n\n".join(context_parts)
@@ -1,14 +1,180 @@
+import asyncio
+import atexit
 import json
 import logging
 import hashlib
+import queue
+import threading
+import time
 import uuid
-from typing import Dict, Any, Optional, Literal
+from typing import Dict, Any, List, Optional, Literal, Tuple
 from datetime import datetime
 
 from utils.config import get_environment_snowflake_connection
 from utils.connection_pool import get_pooled_connection
 from config.settings import settings
 
+# Activity rows are written by a background thread so tool calls don't wait on the INSERT
+ACTIVITY_QUEUE_MAX_SIZE = 10000
+ACTIVITY_BATCH_SIZE = 50
+# Upper bound on how long shutdown waits for queued rows; Snowflake outages must not hang exit
+ACTIVITY_FLUSH_TIMEOUT_SECONDS = 10.0
+
+_ACTIVITY_INSERT_HEADER = """
+        INSERT INTO AI_USER_ACTIVITY_LOG (
+            USER_EMAIL,
+            ACTION_TYPE,
+            ENTITY_TYPE,
+            ENTITY_ID,
+            ACTION_DETAILS,
+            SUCCESS,
+            EXECUTION_TIME_MS,
+            PROCESSING_STAGE,
+            RAW_REQUEST,
+            REQUEST_ID
+        )
+"""
+
+# Use INSERT...SELECT pattern for OBJECT columns; one SELECT per row, joined with UNION ALL
+_ACTIVITY_ROW_SELECT = """
+        SELECT 
+            %s as USER_EMAIL,
+            %s as ACTION_TYPE,
+            %s as ENTITY_TYPE,
+            %s as ENTITY_ID,
+            PARSE_JSON(%s) as ACTION_DETAILS,
+            %s as SUCCESS,
+            %s as EXECUTION_TIME_MS,
+            %s as PROCESSING_STAGE,
+            PARSE_JSON(%s) as RAW_REQUEST,
+            %s as REQUEST_ID
+"""
+
+_activity_queue: "queue.Queue[Tuple[tuple, Dict[str, Any]]]" = queue.Queue(maxsize=ACTIVITY_QUEUE_MAX_SIZE)
+_activity_writer: Optional[threading.Thread] = None
+_activity_writer_lock = threading.Lock()
+
+# Rows queued but not yet written or dropped; flush_activity_log waits on this
+_activity_pending = 0
+_activity_pending_changed = threading.Condition()
+
+# Set once a flush times out so the writer drops what is left instead of
+# reopening the (possibly already closed) connection pool during shutdown
+_activity_stopped = threading.Event()
+
+
+def _log_activity_fallback(context: Dict[str, Any], error: Exception) -> None:
+    """Record an activity row that could not be written to Snowflake"""
+    logging.error(f"Failed to log activity for tool '{context['tool_name']}' (stage: {context['processing_stage']}): {error}")
+    
+    # In production, also try to write to a fallback log with more details
+    if settings.environment == 'production':
+        logging.error(f"Activity log fallback - Tool: {context['tool_name']}, Stage: {context['processing_stage']}, RequestID: {context['request_id']}, Args: {context['arguments']}, Success: {context['execution_success']}")
+
+
+def _write_activity_batch(batch: List[Tuple[tuple, Dict[str, Any]]]) -> None:
+    """Insert a batch of activity rows with a single statement"""
+    insert_sql = _ACTIVITY_INSERT_HEADER + "UNION ALL".join([_ACTIVITY_ROW_SELECT] * len(batch))
+    params = [value for row_params, _ in batch for value in row_params]
+    
+    with get_pooled_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(insert_sql, params)
+        
+        # Ensure the insert is committed
+        conn.commit()
+        
+        cursor.close()
+
+
+def _activity_writer_loop() -> None:
+    """Drain queued activity rows, writing whatever is waiting as one batch"""
+    while True:
+        batch = [_activity_queue.get()]
+        while len(batch) < ACTIVITY_BATCH_SIZE:
+            try:
+                batch.append(_activity_queue.get_nowait())
+            except queue.Empty:
+                break
+        
+        try:
+            if _activity_stopped.is_set():
+                logging.warning(f"Activity log writer stopped; dropping {len(batch)} queued rows")
+            else:
+                _write_activity_batch(batch)
+                logging.debug(f"Successfully logged {len(batch)} activity rows")
+        except Exception as error:
+            logging.error(f"Failed to write activity batch of {len(batch)} rows: {error}", exc_info=True)
+            for _, context in batch:
+                _log_activity_fallback(context, error)
+        finally:
+            _finish_activity_rows(len(batch))
+
+
+def _finish_activity_rows(count: int) -> None:
+    """Mark queued rows as written or dropped and wake any waiting flush"""
+    global _activity_pending
+    
+    with _activity_pending_changed:
+        _activity_pending -= count
+        _activity_pending_changed.notify_all()
+
+
+def _enqueue_activity_row(row_params: tuple, context: Dict[str, Any]) -> None:
+    """Queue one row for the writer, counting it as pending until it is handled"""
+    global _activity_pending
+    
+    with _activity_pending_changed:
+        _activity_pending += 1
+    try:
+        _activity_queue.put_nowait((row_params, context))
+    except queue.Full:
+        _finish_activity_rows(1)
+        raise
+
+
+def _ensure_activity_writer() -> None:
+    """Start the background activity writer on first use"""
+    global _activity_writer
+    
+    if _activity_writer is None:
+        with _activity_writer_lock:
+            if _activity_writer is None:
+                writer = threading.Thread(target=_activity_writer_loop, name="activity-log-writer", daemon=True)
+                writer.start()
+                _activity_writer = writer
+
+
+def flush_activity_log(timeout: float = ACTIVITY_FLUSH_TIMEOUT_SECONDS) -> int:
+    """Wait up to timeout seconds for queued activity rows to be written
+    
+    Returns the number of rows still unwritten when the deadline passed. After
+    a timeout the writer is stopped and drops those rows rather than retrying.
+    """
+    if _activity_writer is None:
+        return 0
+    
+    deadline = time.monotonic() + timeout
+    with _activity_pending_changed:
+        # An earlier flush already gave up; don't wait on the stuck write again
+        if not _activity_stopped.is_set():
+            while _activity_pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                _activity_pending_changed.wait(remaining)
+        pending = _activity_pending
+    
+    if pending and not _activity_stopped.is_set():
+        _activity_stopped.set()
+        logging.warning(f"Activity log flush timed out after {timeout}s; dropping {pending} unwritten rows")
+    return pending
+
+
+# Short-lived processes (CLI, stdio) still get their last rows written
+atexit.register(flush_activity_log)
+
+
 async def log_activity(
     tool_name: str,
     arguments: Dict[str, Any],
@@ -23,7 +189,10 @@ async def log_activity(
     request_id: Optional[str] = None,
     action_type: Optional[str] = None
 ):
-    """Log MCP tool activity to AI_USER_ACTIVITY_LOG
+    """Queue MCP tool activity for AI_USER_ACTIVITY_LOG
+    
+    The row is written by a background thread; this returns without waiting
+    on Snowflake. Call flush_activity_log() to wait for pending rows.
     
     Args:
         tool_name: Name of the MCP tool being executed
@@ -39,105 +208,67 @@ async def log_activity(
         request_id: Unique ID to link pre and post processing entries
         action_type: Override default action_type (e.g., "internal_tool_call")
     """
+    context = {
+        "tool_name": tool_name,
+        "processing_stage": processing_stage,
+        "request_id": request_id,
+        "arguments": arguments,
+        "execution_success": execution_success
+    }
+    
     try:
-        with get_pooled_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Hash bearer token for privacy
-            bearer_token_hash = None
-            if bearer_token:
-                bearer_token_hash = hashlib.sha256(bearer_token.encode()).hexdigest()[:16]
+        # Hash bearer token for privacy
+        bearer_token_hash = None
+        if bearer_token:
+            bearer_token_hash = hashlib.sha256(bearer_token.encode()).hexdigest()[:16]
         
-            # Build ACTION_DETAILS object with context that's not in dedicated columns
-            action_details_obj = {
+        # Build ACTION_DETAILS object with context that's not in dedicated columns
+        action_details_obj = {
             "tool_name": tool_name,
             "arguments": arguments if processing_stage == "post" else None,
             "row_count": row_count if processing_stage == "post" else None,
             "natural_query": natural_query,
             "generated_sql": generated_sql,
             "bearer_token_hash": bearer_token_hash
-            }
-            
-            # Use INSERT...SELECT pattern for OBJECT columns
-            insert_sql = """
-        INSERT INTO AI_USER_ACTIVITY_LOG (
-            USER_EMAIL,
-            ACTION_TYPE,
-            ENTITY_TYPE,
-            ENTITY_ID,
-            ACTION_DETAILS,
-            SUCCESS,
-            EXECUTION_TIME_MS,
-            PROCESSING_STAGE,
-            RAW_REQUEST,
-            REQUEST_ID
+        }
+        
+        # Convert dict to JSON string for Snowflake OBJECT column
+        action_details_json = json.dumps(action_details_obj)
+        
+        # Convert raw_request to JSON string for VARIANT column (or None)
+        raw_request_json = raw_request if raw_request else None
+        
+        # Use provided action_type or default to "tool_execution"
+        if action_type is None:
+            action_type = "tool_execution"
+        
+        row_params = (
+            'mcp_server@popfly.com',  # Generic email for MCP server
+            action_type,
+            'mcp_tool',
+            tool_name,
+            action_details_json,  # JSON string that will be converted by PARSE_JSON()
+            execution_success,
+            execution_time_ms,
+            processing_stage,
+            raw_request_json,  # Raw request JSON string or None
+            request_id
         )
-        SELECT 
-            %s as USER_EMAIL,
-            %s as ACTION_TYPE,
-            %s as ENTITY_TYPE,
-            %s as ENTITY_ID,
-            PARSE_JSON(%s) as ACTION_DETAILS,
-            %s as SUCCESS,
-            %s as EXECUTION_TIME_MS,
-            %s as PROCESSING_STAGE,
-            PARSE_JSON(%s) as RAW_REQUEST,
-            %s as REQUEST_ID
-            """
-            
-            # Convert dict to JSON string for Snowflake OBJECT column
-            action_details_json = json.dumps(action_details_obj)
-            
-            # Convert raw_request to JSON string for VARIANT column (or None)
-            raw_request_json = raw_request if raw_request else None
-            
-            # Use provided action_type or default to "tool_execution"
-            if action_type is None:
-                action_type = "tool_execution"
         
-            cursor.execute(insert_sql, (
-                'mcp_server@popfly.com',  # Generic email for MCP server
-                action_type,
-                'mcp_tool',
-                tool_name,
-                action_details_json,  # JSON string that will be converted by PARSE_JSON()
-                execution_success,
-                execution_time_ms,
-                processing_stage,
-                raw_request_json,  # Raw request JSON string or None
-                request_id
-            ))
-            
-            # Ensure the insert is committed
-            conn.commit()
-            
-            cursor.close()
+        if _activity_stopped.is_set():
+            _log_activity_fallback(context, RuntimeError("activity log writer is stopped"))
+            return
         
-        logging.debug(f"Successfully logged activity for tool: {tool_name}")
+        _ensure_activity_writer()
+        _enqueue_activity_row(row_params, context)
         
+    except queue.Full:
+        # Shed load rather than block the request when Snowflake falls behind
+        _log_activity_fallback(context, RuntimeError("activity log queue is full"))
     except Exception as error:
-        # Log the full error with stack trace for debugging
-        logging.error(f"Failed to log activity for tool '{tool_name}' (stage: {processing_stage}): {error}", exc_info=True)
-        
-        # In production, also try to write to a fallback log with more details
-        if settings.environment == 'production':
-            logging.error(f"Activity log fallback - Tool: {tool_name}, Stage: {processing_stage}, RequestID: {request_id}, Args: {arguments}, Success: {execution_success}")
+        logging.error(f"Failed to queue activity for tool '{tool_name}' (stage: {processing_stage}): {error}", exc_info=True)
 
-async def log_cortex_usage(
-    natural_query: str,
-    generated_sql: str,
-    validation_passed: bool,
-    view_name: str,
-    model_name: str = None,
-    credits_used: float = None,
-    execution_time_ms: int = None
-):
-    """Log Cortex usage to AI_CORTEX_USAGE_LOG"""
-    try:
-        with get_pooled_connection() as conn:
-            cursor = conn.cursor()
-            
-            insert_sql = """
+_CORTEX_USAGE_INSERT = """
         INSERT INTO AI_CORTEX_USAGE_LOG (
             USER_EMAIL,
             FUNCTION_NAME,
@@ -150,9 +281,31 @@ async def log_cortex_usage(
         ) VALUES (
             %s, %s, %s, %s, %s, %s, %s, %s
         )
-            """
-            
-            cursor.execute(insert_sql, (
+"""
+
+
+def _write_cortex_usage(params: tuple) -> None:
+    """Insert one AI_CORTEX_USAGE_LOG row (blocking; call via asyncio.to_thread)"""
+    with get_pooled_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(_CORTEX_USAGE_INSERT, params)
+        
+        conn.commit()
+        cursor.close()
+
+
+async def log_cortex_usage(
+    natural_query: str,
+    generated_sql: str,
+    validation_passed: bool,
+    view_name: str,
+    model_name: str = None,
+    credits_used: float = None,
+    execution_time_ms: int = None
+):
+    """Log Cortex usage to AI_CORTEX_USAGE_LOG"""
+    try:
+        await asyncio.to_thread(_write_cortex_usage, (
             'mcp_server@popfly.com',
             'COMPLETE',  # Using COMPLETE function
             natural_query,
@@ -161,10 +314,7 @@ async def log_cortex_usage(
             validation_passed,
             credits_used,  # Using as token approximation
             execution_time_ms
-            ))
-            
-            conn.commit()
-            cursor.close()
+        ))
         
     except Exception as error:
         logging.warning(f"Failed to log Cortex usage: {error}")
@@ -31,7 +31,35 @@ class SqlValidator:
         r'\'.*OR.*\'.*=.*\'',
     ]
     
-    READ_ONLY_KEYWORDS = ['SELECT', 'SHOW', 'DESCRIBE', 'EXPLAIN', 'WITH']
+    # Compiled once at import; validate_sql_query runs on every tool call
+    DANGEROUS_REGEXES = [re.compile(pattern, re.IGNORECASE) for pattern in DANGEROUS_PATTERNS]
+    
+    READ_ONLY_KEYWORDS = ('SELECT', 'SHOW', 'DESCRIBE', 'EXPLAIN', 'WITH')
+    
+    # SQL keywords and functions skipped when extracting column references
+    NON_COLUMN_KEYWORDS = frozenset({
+        'SELECT', 'FROM', 'WHERE', 'AND', 'OR', 'AS', 'COUNT',
+        'SUM', 'AVG', 'MIN', 'MAX', 'DISTINCT', 'CASE', 'WHEN',
+        'THEN', 'END', 'ELSE', 'NULL', 'NOT', 'IN', 'LIKE',
+        'BETWEEN', 'EXISTS', 'ANY', 'ALL', 'EXTRACT', 'YEAR',
+        'MONTH', 'DAY', 'LIMIT', 'DESC', 'ASC'
+    })
+    
+    # Clauses scanned for column references
+    COLUMN_CLAUSE_REGEXES = [
+        re.compile(r'SELECT\s+(.*?)\s+FROM', re.DOTALL),  # Columns in SELECT
+        re.compile(r'WHERE\s+(.*?)(?:GROUP|ORDER|LIMIT|$)', re.DOTALL),  # Columns in WHERE
+        re.compile(r'GROUP\s+BY\s+(.*?)(?:HAVING|ORDER|LIMIT|$)', re.DOTALL),  # Columns in GROUP BY
+        re.compile(r'ORDER\s+BY\s+(.*?)(?:LIMIT|$)', re.DOTALL),  # Columns in ORDER BY
+    ]
+    IDENTIFIER_REGEX = re.compile(r'\b([A-Z_][A-Z0-9_]*)\b')
+    
+    # Function calls whose FROM keyword is not a table reference
+    NON_TABLE_FROM_REGEXES = [
+        re.compile(r'EXTRACT\s*\([^)]+\)'),
+        re.compile(r'TO_DATE\s*\([^)]+\)'),
+    ]
+    TABLE_REFERENCE_REGEX = re.compile(r'(?:FROM|JOIN)\s+([\w.]+)')
     
     ALLOWED_TABLES = {
         'MV_CREATOR_PAYMENTS_UNION',  # Materialized table
@@ -57,21 +85,22 @@ class SqlValidator:
         """Comprehensive SQL query validation"""
         sql_upper = sql.upper().strip()
         
+        # Verify it's a read-only operation first: a prefix compare rejects
+        # writes and DDL without scanning every dangerous pattern
+        if not sql_upper.startswith(cls.READ_ONLY_KEYWORDS):
+            error = "Only read-only operations (SELECT, SHOW, DESCRIBE) are allowed"
+            if sql_upper:
+                error += f", got {sql_upper.split(None, 1)[0]}"
+            return SqlValidationResult(is_valid=False, error=error)
+        
         # Check for dangerous patterns
-        for pattern in cls.DANGEROUS_PATTERNS:
-            if re.search(pattern, sql_upper, re.IGNORECASE):
+        for regex in cls.DANGEROUS_REGEXES:
+            if regex.search(sql_upper):
                 return SqlValidationResult(
                     is_valid=False,
-                    error=f"Dangerous SQL operation detected: {pattern}"
+                    error=f"Dangerous SQL operation detected: {regex.pattern}"
                 )
         
-        # Verify it's a read-only operation
-        if not cls.is_read_only_query(sql):
-            return SqlValidationResult(
-                is_valid=False,
-                error="Only read-only operations (SELECT, SHOW, DESCRIBE) are allowed"
-            )
-        
         # Validate table access
         table_validation = cls.validate_table_access(sql)
         if not table_validation.is_valid:
@@ -89,7 +118,7 @@ class SqlValidator:
     def is_read_only_query(cls, sql: str) -> bool:
         """Check if SQL query is read-only"""
         sql_upper = sql.strip().upper()
-        return any(sql_upper.startswith(keyword) for keyword in cls.READ_ONLY_KEYWORDS)
+        return sql_upper.startswith(cls.READ_ONLY_KEYWORDS)
 
     @classmethod
     def validate_column_existence(cls, sql: str) -> SqlValidationResult:
@@ -98,28 +127,17 @@ class SqlValidator:
         
         # Extract column references from SQL
         # This finds columns in SELECT, WHERE, GROUP BY, ORDER BY, etc.
-        column_patterns = [
-            r'SELECT\s+(.*?)\s+FROM',  # Columns in SELECT
-            r'WHERE\s+(.*?)(?:GROUP|ORDER|LIMIT|$)',  # Columns in WHERE
-            r'GROUP\s+BY\s+(.*?)(?:HAVING|ORDER|LIMIT|$)',  # Columns in GROUP BY
-            r'ORDER\s+BY\s+(.*?)(?:LIMIT|$)',  # Columns in ORDER BY
-        ]
-        
         referenced_columns = set()
-        for pattern in column_patterns:
-            matches = re.findall(pattern, sql_upper, re.DOTALL)
+        for regex in cls.COLUMN_CLAUSE_REGEXES:
+            matches = regex.findall(sql_upper)
             for match in matches:
                 # Extract individual column names (handling functions, aliases, etc.)
                 # This is a simplified extraction - a full SQL parser would be better
-                potential_cols = re.findall(r'\b([A-Z_][A-Z0-9_]*)\b', match)
-                for col in potential_cols:
-                    # Skip SQL keywords and functions
-                    if col not in ['SELECT', 'FROM', 'WHERE', 'AND', 'OR', 'AS', 'COUNT', 
-                                   'SUM', 'AVG', 'MIN', 'MAX', 'DISTINCT', 'CASE', 'WHEN', 
-                                   'THEN', 'END', 'ELSE', 'NULL', 'NOT', 'IN', 'LIKE', 
-                                   'BETWEEN', 'EXISTS', 'ANY', 'ALL', 'EXTRACT', 'YEAR', 
-                                   'MONTH', 'DAY', 'LIMIT', 'DESC', 'ASC']:
-                        referenced_columns.add(col)
+                potential_cols = cls.IDENTIFIER_REGEX.findall(match)
+                # Skip SQL keywords and functions
+                referenced_columns.update(
+                    col for col in potential_cols if col not in cls.NON_COLUMN_KEYWORDS
+                )
         
         # Check if any referenced column is not in our known valid columns
         # For now, skip this validation since we don't have VALID_COLUMNS anymore
@@ -138,11 +156,11 @@ class SqlValidator:
         # Look for FROM and JOIN clauses - capture full table names including schema
         # Pattern matches: word, word.word, word.word.word (database.schema.table)
         # But exclude function calls like EXTRACT(YEAR FROM ...)
-        sql_clean = re.sub(r'EXTRACT\s*\([^)]+\)', '', sql_upper)  # Remove EXTRACT functions
-        sql_clean = re.sub(r'TO_DATE\s*\([^)]+\)', '', sql_clean)  # Remove TO_DATE functions
+        sql_clean = sql_upper
+        for regex in cls.NON_TABLE_FROM_REGEXES:  # Remove EXTRACT / TO_DATE functions
+            sql_clean = regex.sub('', sql_clean)
         
-        table_references = re.findall(r'FROM\s+([\w.]+)', sql_clean)
-        table_references.extend(re.findall(r'JOIN\s+([\w.]+)', sql_clean))
+        table_references = cls.TABLE_REFERENCE_REGEX.findall(sql_clean)
         
         # Check if any referenced table is not in allowed list
         for table_ref in table_references: